@@ -5,8 +5,95 @@ Creates a pleasant bell-like sound using sine waves
 """
 
 import wave
-import struct
 import math
+import array
+import sys
+from pathlib import Path
+
+# Try to import numpy, fall back to the pure-Python sample loop if not available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def pack_samples(samples):
+    """
+    Pack 16-bit samples into little-endian PCM bytes
+    
+    Args:
+        samples: NumPy int16 array or array.array('h')
+    
+    Returns:
+        bytes: Frame data ready for a single writeframes call
+    """
+    if NUMPY_AVAILABLE:
+        return samples.astype('<i2').tobytes()
+    
+    # array.array stores native-endian values, WAV wants little-endian
+    if sys.byteorder == 'big':
+        samples = array.array('h', samples)
+        samples.byteswap()
+    return samples.tobytes()
+
+def write_wav(filename, samples, sample_rate):
+    """
+    Write 16-bit mono samples to a WAV file
+    
+    Args:
+        filename: Output WAV filename
+        samples: Samples as accepted by pack_samples
+        sample_rate: Audio sample rate in Hz
+    """
+    frames = pack_samples(samples)
+    
+    # Size the buffer to hold the whole file so header and data go out in one
+    # write, and declare the frame count up front so the header never needs
+    # to be patched on close
+    with open(filename, 'wb', buffering=len(frames) + 64) as f:
+        with wave.open(f, 'wb') as wav_file:
+            wav_file.setnchannels(1)        # Mono
+            wav_file.setsampwidth(2)        # 2 bytes (16-bit)
+            wav_file.setframerate(sample_rate)
+            wav_file.setnframes(len(samples))
+            wav_file.writeframes(frames)
+
+def synth_bell(out, sample_rate, duration, frequencies, amplitudes):
+    """
+    Fill a preallocated buffer with bell samples (pure-Python path)
+    
+    Args:
+        out: Preallocated array.array('h'), one slot per sample
+        sample_rate: Audio sample rate in Hz
+        duration: Duration in seconds
+        frequencies: Tone frequencies in Hz
+        amplitudes: Relative volume of each frequency
+    """
+    # Strength-reduce the loop: phase advances by a fixed step per sample and
+    # the exponential decay by a fixed factor, so no divide or exp per sample
+    partials = [(2 * math.pi * freq / sample_rate, amp) for freq, amp in zip(frequencies, amplitudes)]
+    decay = 1.0
+    decay_step = math.exp(-4 / (duration * sample_rate))
+    fade_in_samples = 0.01 * sample_rate
+    sin = math.sin
+    
+    for i in range(len(out)):
+        sample = 0
+        
+        # Combine multiple sine waves for richer sound
+        for phase_step, amp in partials:
+            sample += sin(phase_step * i) * amp
+        
+        # Apply exponential decay for natural bell fade
+        sample *= decay
+        decay *= decay_step
+        
+        # Apply slight fade in at the start to avoid clicks
+        if i < fade_in_samples:
+            sample *= i / fade_in_samples
+        
+        # Convert to 16-bit integer (-32768 to 32767)
+        out[i] = int(sample * 32767 * 0.8)  # 0.8 to avoid clipping
 
 def generate_notification_sound(
     filename="notification.wav",
@@ -28,41 +115,46 @@ def generate_notification_sound(
     frequencies = [800, 1200, 1600]  # Main tone and harmonics
     amplitudes = [0.5, 0.3, 0.2]     # Relative volumes
     
-    samples = []
-    
-    for i in range(num_samples):
-        t = i / sample_rate
-        sample = 0
+    if NUMPY_AVAILABLE:
+        # Compute every sample at once as array expressions
+        t = np.arange(num_samples) / sample_rate
+        sample = np.zeros(num_samples)
         
-        # Combine multiple sine waves for richer sound
+        # Combine multiple sine waves for richer sound. The tones are all
+        # harmonics of one base tone (800/1200/1600 Hz = 2/3/4 x 400 Hz), so
+        # only sin and cos of the base are evaluated and each harmonic follows
+        # from sin((n+1)x) = 2cos(x)sin(nx) - sin((n-1)x)
+        base = math.gcd(*frequencies)
+        weights = [0.0] * (max(frequencies) // base + 1)
         for freq, amp in zip(frequencies, amplitudes):
-            sample += math.sin(2 * math.pi * freq * t) * amp
+            weights[freq // base] += amp
+        
+        x = 2 * np.pi * base * t
+        two_cos = 2 * np.cos(x)
+        prev, cur = np.zeros(num_samples), np.sin(x)
+        sample += cur * weights[1]
+        for n in range(2, len(weights)):
+            prev, cur = cur, two_cos * cur - prev
+            sample += cur * weights[n]
         
         # Apply exponential decay for natural bell fade
-        decay = math.exp(-4 * t / duration)
-        sample *= decay
+        sample *= np.exp(-4 * t / duration)
         
         # Apply slight fade in at the start to avoid clicks
-        if t < 0.01:
-            fade_in = t / 0.01
-            sample *= fade_in
+        sample *= np.minimum(t / 0.01, 1.0)
         
         # Convert to 16-bit integer (-32768 to 32767)
-        sample_int = int(sample * 32767 * 0.8)  # 0.8 to avoid clipping
-        samples.append(sample_int)
+        samples = (sample * 32767 * 0.8).astype(np.int16)  # 0.8 to avoid clipping
+    else:
+        # 2 bytes per sample, rather than a pointer plus an int object in a list
+        samples = array.array('h', bytes(2 * num_samples))
+        synth_bell(samples, sample_rate, duration, frequencies, amplitudes)
     
     # Write WAV file
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)        # Mono
-        wav_file.setsampwidth(2)        # 2 bytes (16-bit)
-        wav_file.setframerate(sample_rate)
-        
-        for sample in samples:
-            wav_file.writeframes(struct.pack('h', sample))
+    write_wav(filename, samples, sample_rate)
     
     # Get file size
-    import os
-    file_size = os.path.getsize(filename)
+    file_size = Path(filename).stat().st_size
     
     print(f"✓ Generated {filename}")
     print(f"  Duration: {duration}s")
@@ -87,30 +179,31 @@ def generate_simple_beep(
         sample_rate: Audio sample rate in Hz
     """
     num_samples = int(sample_rate * duration)
-    samples = []
     
-    for i in range(num_samples):
-        t = i / sample_rate
+    if NUMPY_AVAILABLE:
+        t = np.arange(num_samples) / sample_rate
         # Linear fade out
         fade = 1.0 - (t / duration)
-        sample = math.sin(2 * math.pi * frequency * t) * fade
-        sample_int = int(sample * 32767)
-        samples.append(sample_int)
+        sample = np.sin(2 * np.pi * frequency * t) * fade
+        samples = (sample * 32767).astype(np.int16)
+    else:
+        samples = array.array('h', bytes(2 * num_samples))
+        omega = 2 * math.pi * frequency
+        sin = math.sin
+        
+        for i in range(num_samples):
+            t = i / sample_rate
+            # Linear fade out
+            fade = 1.0 - (t / duration)
+            sample = sin(omega * t) * fade
+            samples[i] = int(sample * 32767)
     
     # Write WAV file
-    with wave.open(filename, 'w') as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        
-        for sample in samples:
-            wav_file.writeframes(struct.pack('h', sample))
+    write_wav(filename, samples, sample_rate)
     
     print(f"✓ Generated {filename} (simple beep)")
 
 if __name__ == "__main__":
-    import sys
-    
     print("Task Timer CLI - Notification Sound Generator\n")
     
     # Check if user wants simple or bell sound
@@ -6,36 +6,43 @@ Task Timer CLI - A simple pomodoro timer and task tracker
 import time
 import json
 import os
-from datetime import datetime
+import math
+import signal
+import threading
+from collections import Counter
+from importlib.util import find_spec
 from pathlib import Path
 import sys
 
-# Try to import colorama, fall back gracefully if not available
-try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-    COLORS_AVAILABLE = True
-except ImportError:
-    COLORS_AVAILABLE = False
-    # Create dummy color constants if colorama is not available
-    class Fore:
-        GREEN = ''
-        YELLOW = ''
-        RED = ''
-        CYAN = ''
-        BLUE = ''
-        MAGENTA = ''
-    
-    class Style:
-        BRIGHT = ''
-        RESET_ALL = ''
-
-# Try to import playsound, fall back gracefully if not available
+# Dummy color constants, replaced by colorama's once init_colors() runs.
+# Importing this module (e.g. from the GUI) never pays for colorama;
+# at startup just check whether it is installed.
+COLORS_AVAILABLE = find_spec("colorama") is not None
+
+class Fore:
+    GREEN = ''
+    YELLOW = ''
+    RED = ''
+    CYAN = ''
+    BLUE = ''
+    MAGENTA = ''
+
+class Style:
+    BRIGHT = ''
+    RESET_ALL = ''
+
+# Sound backends are only imported when a notification actually plays;
+# at startup just check whether they are installed.
+# simpleaudio is preferred since it can replay a loaded sound without re-reading it.
+SIMPLEAUDIO_AVAILABLE = find_spec("simpleaudio") is not None
+SOUND_AVAILABLE = SIMPLEAUDIO_AVAILABLE or find_spec("playsound") is not None
+
+# Try to import orjson for faster task file I/O, fall back to json if not available
 try:
-    from playsound import playsound
-    SOUND_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    SOUND_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Default file paths
 DATA_FILE = Path.home() / ".task_timer_data.json"
@@ -48,29 +55,117 @@ DEFAULT_CONFIG = {
     "default_break": 5,
     "sound_enabled": True,
     "data_file": str(DATA_FILE),
-    "sound_file": str(SOUND_FILE)
+    "sound_file": str(SOUND_FILE),
+    "journal": False
 }
 
+# Set by Ctrl-C while a timer is running to end its wait early
+TIMER_STOP = threading.Event()
+
+# simpleaudio WaveObjects by sound file path, loaded on first play
+_WAVE_CACHE = {}
+
+# Encoded task lists by data file path, with the file stamps they were read at
+_TASKS_CACHE = {}
+
+# (config file stamp, merged config) from the last load_config()
+_CONFIG_CACHE = None
+
+def init_colors():
+    """Switch to colorama's color constants, if colorama is installed"""
+    global COLORS_AVAILABLE, Fore, Style
+    
+    # colorama strips colors from piped or redirected output anyway,
+    # so there it isn't worth importing at all
+    if not sys.stdout.isatty():
+        return
+    
+    try:
+        from colorama import init, Fore, Style
+    except ImportError:
+        COLORS_AVAILABLE = False
+        return
+    
+    init(autoreset=True)
+
+def file_stamp(path):
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def write_atomic(path, data):
+    """
+    Replace a file's contents in one step
+    
+    The bytes go to a temporary file next to it that is then swapped in, so
+    an interrupted save (e.g. Ctrl-C) never leaves a truncated file behind.
+    TASK_TIMER_FSYNC=1 also flushes it to disk first, to survive power loss.
+    
+    Symlinks are followed, so a linked file is updated in place of the link,
+    and the file keeps its permissions.
+    """
+    path = path.resolve()
+    tmp_file = path.with_name(path.name + '.tmp')
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    
+    try:
+        with open(tmp_file, 'wb') as f:
+            # Restrict the temporary file before any data lands in it
+            if mode is not None:
+                os.chmod(tmp_file, mode)
+            f.write(data)
+            if os.environ.get("TASK_TIMER_FSYNC") == "1":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
 def load_config():
-    """Load configuration from file or create with defaults"""
-    if CONFIG_FILE.exists():
+    """
+    Load configuration from file or create with defaults
+    
+    The file is only re-read when its stamp changes; callers get their own
+    copy, so they can modify it freely.
+    """
+    global _CONFIG_CACHE
+    
+    stamp = file_stamp(CONFIG_FILE)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stamp:
+        return _CONFIG_CACHE[1].copy()
+    
+    config = DEFAULT_CONFIG.copy()
+    if stamp is not None:
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults to handle missing keys
-                merged_config = DEFAULT_CONFIG.copy()
-                merged_config.update(config)
-                return merged_config
+            data = CONFIG_FILE.read_bytes()
+            # Merge with defaults to handle missing keys
+            config.update(orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data))
         except Exception as e:
             print(f"{Fore.YELLOW}Warning: Could not load config, using defaults{Style.RESET_ALL}")
-            return DEFAULT_CONFIG.copy()
-    return DEFAULT_CONFIG.copy()
+            config = DEFAULT_CONFIG.copy()
+    
+    _CONFIG_CACHE = (stamp, config)
+    return config.copy()
 
 def save_config(config):
     """Save configuration to file"""
+    global _CONFIG_CACHE
+    
+    # Force the next load_config() to read what was written
+    _CONFIG_CACHE = None
+    
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            write_atomic(CONFIG_FILE, orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            write_atomic(CONFIG_FILE, json.dumps(config, indent=2).encode('utf-8'))
         return True
     except Exception as e:
         print(f"{Fore.RED}Error saving config: {e}{Style.RESET_ALL}")
@@ -88,13 +183,14 @@ def show_config():
     """Display current configuration"""
     config = load_config()
     print(f"\n{Fore.BLUE}{Style.BRIGHT}⚙️  Current Configuration:{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}-" * 60 + Style.RESET_ALL)
+    print(f"{Fore.BLUE}{'-' * 60}{Style.RESET_ALL}")
     print(f"Default task duration: {Fore.CYAN}{config['default_duration']} minutes{Style.RESET_ALL}")
     print(f"Default break duration: {Fore.CYAN}{config['default_break']} minutes{Style.RESET_ALL}")
     print(f"Sound enabled: {Fore.CYAN}{config['sound_enabled']}{Style.RESET_ALL}")
     print(f"Data file: {Fore.CYAN}{config['data_file']}{Style.RESET_ALL}")
     print(f"Sound file: {Fore.CYAN}{config['sound_file']}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}-" * 60 + Style.RESET_ALL)
+    print(f"Journal writes: {Fore.CYAN}{config['journal']}{Style.RESET_ALL}")
+    print(f"{Fore.BLUE}{'-' * 60}{Style.RESET_ALL}")
     print(f"\n{Fore.YELLOW}Config file location: {CONFIG_FILE}{Style.RESET_ALL}")
 
 def update_config(key, value):
@@ -111,13 +207,13 @@ def update_config(key, value):
         except ValueError:
             print(f"{Fore.RED}Error: Duration must be a number{Style.RESET_ALL}")
             return False
-    elif key == "sound_enabled":
+    elif key == "sound_enabled" or key == "journal":
         if value.lower() in ['true', '1', 'yes', 'on']:
             value = True
         elif value.lower() in ['false', '0', 'no', 'off']:
             value = False
         else:
-            print(f"{Fore.RED}Error: sound_enabled must be true/false{Style.RESET_ALL}")
+            print(f"{Fore.RED}Error: {key} must be true/false{Style.RESET_ALL}")
             return False
     elif key == "data_file" or key == "sound_file":
         # Expand ~ to home directory
@@ -140,41 +236,331 @@ def reset_config():
         return True
     return False
 
-def load_tasks():
-    """Load tasks from JSON file"""
-    config = load_config()
-    data_file = Path(config['data_file'])
+def timestamp():
+    """Return the current local time as an ISO 8601 string, to the second"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+def journal_path(data_file):
+    """
+    Return the journal file that sits next to a data file
     
-    if data_file.exists():
-        with open(data_file, 'r') as f:
-            return json.load(f)
-    return []
+    The suffix is appended rather than swapped in, so the journal can never
+    be the data file itself (e.g. for a data file named 'tasks.jsonl').
+    """
+    data_file = Path(data_file)
+    return data_file.with_name(data_file.name + '.journal')
 
-def save_tasks(tasks):
-    """Save tasks to JSON file"""
-    config = load_config()
-    data_file = Path(config['data_file'])
+def replay_journal(tasks, journal_file):
+    """
+    Apply the mutations recorded in a journal file to a task list
+    
+    Args:
+        tasks: Task list loaded from the data file
+        journal_file: Path of the journal to replay
+    
+    Returns:
+        list: The task list with every journaled mutation applied
+    """
+    with open(journal_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A write cut short by a crash leaves a partial last line
+                continue
+            
+            if record["op"] == "add":
+                tasks.append(record["task"])
+            elif record["op"] == "delete":
+                tasks = [t for t in tasks if t["id"] != record["id"]]
+            elif record["op"] == "complete":
+                for task in tasks:
+                    if task["id"] == record["id"]:
+                        task["completed"] = True
+                        task["completed_at"] = record["completed_at"]
+    return tasks
+
+def load_tasks(data_file=None):
+    """
+    Load tasks from JSON file, replaying the journal if there is one
+    
+    While neither file has changed on disk the encoded tasks are kept in
+    memory, so the files aren't read again. Each call still decodes a fresh
+    list, so callers (e.g. several TaskManagers) never share task dicts.
+    
+    Args:
+        data_file: Data file to read (defaults to the configured one)
+    """
+    if data_file is None:
+        data_file = load_config()['data_file']
+    data_file = Path(data_file)
+    journal_file = journal_path(data_file)
+    stamp = (file_stamp(data_file), file_stamp(journal_file))
+    
+    cached = _TASKS_CACHE.get(data_file)
+    if cached is not None and cached[0] == stamp:
+        data = cached[1]
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    
+    # The stat above already tells us whether there is anything to parse;
+    # an empty data file (e.g. one created by hand) holds no tasks
+    data = b'[]'
+    if stamp[0] is not None and stamp[0][1] > 0:
+        data = data_file.read_bytes()
+    # json.loads detects the encoding of bytes, so orjson's UTF-8 output reads fine
+    tasks = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    
+    if stamp[1] is not None:
+        tasks = replay_journal(tasks, journal_file)
+        data = orjson.dumps(tasks) if ORJSON_AVAILABLE else json.dumps(tasks).encode('utf-8')
+    
+    _TASKS_CACHE[data_file] = (stamp, data)
+    return tasks
+
+def save_tasks(tasks, data_file=None):
+    """
+    Save tasks to JSON file, folding in (and removing) any journal
+    
+    Args:
+        tasks: Task list to write
+        data_file: Data file to write (defaults to the configured one)
+    """
+    if data_file is None:
+        data_file = load_config()['data_file']
+    data_file = Path(data_file)
+    
+    # Compact output is much cheaper to produce (json's indent mode runs in
+    # pure Python); set TASK_TIMER_PRETTY=1 for a hand-readable file
+    pretty = os.environ.get("TASK_TIMER_PRETTY") == "1"
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(tasks, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        data = json.dumps(tasks, indent=2).encode('utf-8')
+    else:
+        data = json.dumps(tasks, separators=(',', ':')).encode('utf-8')
+    
+    write_atomic(data_file, data)
     
-    with open(data_file, 'w') as f:
-        json.dump(tasks, f, indent=2)
+    # The data file now holds every change, so the journal is no longer needed.
+    # Never delete what is really the data file (e.g. via a symlink).
+    journal_file = journal_path(data_file)
+    if journal_file.resolve() != data_file.resolve():
+        journal_file.unlink(missing_ok=True)
+    
+    _TASKS_CACHE[data_file] = ((file_stamp(data_file), None), data)
+
+def append_journal(record, data_file=None):
+    """
+    Append one mutation record to the journal next to the data file
+    
+    Args:
+        record: Mutation to record
+        data_file: Data file the journal belongs to (defaults to the configured one)
+    """
+    if data_file is None:
+        data_file = load_config()['data_file']
+    
+    with open(journal_path(data_file), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + "\n")
+
+def play_sound_file(sound_file):
+    """Play a sound file with the best available backend, ignoring any failure"""
+    # No exists() check up front: a missing file fails the load below,
+    # which is silently ignored like any other playback error
+    try:
+        if SIMPLEAUDIO_AVAILABLE:
+            import simpleaudio
+            
+            # Parse the WAV once; a break after a task replays it from memory
+            wave_obj = _WAVE_CACHE.get(sound_file)
+            if wave_obj is None:
+                wave_obj = simpleaudio.WaveObject.from_wave_file(str(sound_file))
+                _WAVE_CACHE[sound_file] = wave_obj
+            wave_obj.play().wait_done()
+        else:
+            from playsound import playsound
+            playsound(str(sound_file))
+    except Exception as e:
+        # Silently fail if sound playback fails
+        pass
 
 def play_notification_sound():
-    """Play notification sound if available and enabled"""
+    """Play notification sound if available and enabled, without waiting for it"""
     config = load_config()
     
-    if not config['sound_enabled']:
+    if not config['sound_enabled'] or not SOUND_AVAILABLE:
         return
     
-    if SOUND_AVAILABLE:
-        sound_file = Path(config['sound_file'])
-        if sound_file.exists():
-            try:
-                playsound(str(sound_file))
-            except Exception as e:
-                # Silently fail if sound playback fails
-                pass
+    # Play in the background so the completion message, or the GUI's event
+    # loop, isn't held up for the length of the sound. The thread isn't a
+    # daemon, so the CLI still lets the sound finish before it exits.
+    threading.Thread(target=play_sound_file, args=(Path(config['sound_file']),)).start()
 
-def add_task(name, duration=None, tags=None):
+class TaskManager:
+    """
+    In-memory task list shared by the CLI helpers and the GUI
+    
+    The data file is read once when the manager is created; every mutation
+    updates the list in place and writes it back.
+    """
+    
+    def __init__(self):
+        self.tasks = self._load()
+    
+    @property
+    def tasks(self):
+        """List of task dicts, in creation order"""
+        return self._tasks
+    
+    @tasks.setter
+    def tasks(self, tasks):
+        self._tasks = tasks
+        # Index tasks by ID for O(1) lookups. Iterate in reverse so the first
+        # task wins if an older data file contains duplicate IDs.
+        self._by_id = {t["id"]: t for t in reversed(tasks)}
+        self._next_id = max(self._by_id, default=0) + 1
+    
+    def _load(self):
+        """Load tasks from the data file"""
+        return load_tasks()
+    
+    def reload(self):
+        """Replace the in-memory tasks with the current contents of the data file"""
+        self.tasks = self._load()
+    
+    def _save(self, data_file=None):
+        """Save the in-memory tasks to the data file"""
+        save_tasks(self.tasks, data_file)
+    
+    def _commit(self, record):
+        """
+        Persist a single mutation
+        
+        With the 'journal' setting on, the change is appended to the journal
+        instead of rewriting the whole data file.
+        """
+        config = load_config()
+        data_file = Path(config['data_file'])
+        if not config['journal']:
+            self._save(data_file)
+            return
+        
+        append_journal(record, data_file)
+        
+        # Fold the journal in once it outgrows the data file, so replaying it
+        # never costs more than reading the data file itself
+        data_stamp = file_stamp(data_file)
+        data_size = data_stamp[1] if data_stamp else 0
+        if journal_path(data_file).stat().st_size > data_size:
+            self._save(data_file)
+    
+    def compact(self):
+        """Rewrite the data file from memory and drop the journal"""
+        self._save()
+    
+    def get_task(self, task_id):
+        """Return the task with the given ID, or None if it doesn't exist"""
+        return self._by_id.get(task_id)
+    
+    def add(self, name, duration=None, tags=None):
+        """
+        Add a new task
+        
+        Args:
+            name: Task name
+            duration: Task duration in minutes (uses config default if None)
+            tags: List of tags for categorization
+        
+        Returns:
+            dict: The newly created task
+        """
+        # Use default duration from config if not specified
+        if duration is None:
+            duration = load_config()['default_duration']
+        
+        task = {
+            "id": self._next_id,
+            "name": name,
+            "duration": duration,
+            "completed": False,
+            "created_at": timestamp(),
+            "tags": tags if tags else []
+        }
+        self._tasks.append(task)
+        self._by_id[task["id"]] = task
+        self._next_id += 1
+        self._commit({"op": "add", "task": task})
+        return task
+    
+    def delete(self, task_id):
+        """
+        Delete a task
+        
+        Returns:
+            bool: True if the task existed and was deleted
+        """
+        if self._by_id.pop(task_id, None) is None:
+            return False
+        
+        self._tasks = [t for t in self._tasks if t["id"] != task_id]
+        self._commit({"op": "delete", "id": task_id})
+        return True
+    
+    def complete_task(self, task_id):
+        """
+        Mark a task as completed
+        
+        Returns:
+            bool: True if the task exists
+        """
+        task = self.get_task(task_id)
+        if not task:
+            return False
+        
+        task["completed"] = True
+        task["completed_at"] = timestamp()
+        self._commit({"op": "complete", "id": task_id, "completed_at": task["completed_at"]})
+        return True
+    
+    def get_stats(self, filter_tag=None):
+        """
+        Compute completion statistics in a single pass over the tasks
+        
+        Args:
+            filter_tag: Optional tag to restrict the statistics to
+        
+        Returns:
+            dict: Total and completed task counts, minutes spent on completed tasks,
+                and (when not filtering) the same figures per lowercased tag
+        """
+        total = completed = total_time = 0
+        ft = filter_tag.lower() if filter_tag else None
+        by_tag = {}
+        
+        for t in self._tasks:
+            if ft and not any(tag.lower() == ft for tag in t.get("tags", ())):
+                continue
+            
+            total += 1
+            if t["completed"]:
+                completed += 1
+                total_time += t["duration"]
+            
+            if not ft:
+                for tag in t.get("tags", ()):
+                    # Look each tag's counters up once, then update them in place
+                    tag_stats = by_tag.get(tag.lower())
+                    if tag_stats is None:
+                        tag_stats = by_tag[tag.lower()] = {"total": 0, "completed": 0, "time": 0}
+                    
+                    tag_stats["total"] += 1
+                    if t["completed"]:
+                        tag_stats["completed"] += 1
+                        tag_stats["time"] += t["duration"]
+        
+        return {"total": total, "completed": completed, "total_time": total_time, "by_tag": by_tag}
+
+def add_task(name, duration=None, tags=None, tm=None):
     """
     Add a new task
     
@@ -182,40 +568,34 @@ def add_task(name, duration=None, tags=None):
         name: Task name
         duration: Task duration in minutes (uses config default if None)
         tags: List of tags for categorization
+        tm: TaskManager to use (loads a new one if None)
     """
-    config = load_config()
+    if tm is None:
+        tm = TaskManager()
     
-    # Use default duration from config if not specified
-    if duration is None:
-        duration = config['default_duration']
-    
-    tasks = load_tasks()
-    task = {
-        "id": len(tasks) + 1,
-        "name": name,
-        "duration": duration,
-        "completed": False,
-        "created_at": datetime.now().isoformat(),
-        "tags": tags if tags else []
-    }
-    tasks.append(task)
-    save_tasks(tasks)
+    task = tm.add(name, duration, tags)
+    duration = task["duration"]
     
     tags_str = f" {Fore.MAGENTA}[{', '.join(tags)}]{Style.RESET_ALL}" if tags else ""
     print(f"{Fore.GREEN}✓ Task added: {Style.BRIGHT}{name}{Style.RESET_ALL}{tags_str} {Fore.CYAN}({duration} minutes){Style.RESET_ALL}")
 
-def list_tasks(filter_tag=None):
+def list_tasks(filter_tag=None, tm=None):
     """
     List all tasks, optionally filtered by tag
     
     Args:
         filter_tag: Optional tag to filter tasks by
+        tm: TaskManager to use (loads a new one if None)
     """
-    tasks = load_tasks()
+    if tm is None:
+        tm = TaskManager()
+    
+    tasks = tm.tasks
     
     # Filter by tag if specified
     if filter_tag:
-        tasks = [t for t in tasks if filter_tag.lower() in [tag.lower() for tag in t.get("tags", [])]]
+        ft = filter_tag.lower()
+        tasks = [t for t in tasks if any(tag.lower() == ft for tag in t.get("tags", ()))]
         if not tasks:
             print(f"{Fore.YELLOW}No tasks found with tag '{filter_tag}'{Style.RESET_ALL}")
             return
@@ -224,13 +604,16 @@ def list_tasks(filter_tag=None):
         print(f"{Fore.YELLOW}No tasks found. Add one with 'add' command!{Style.RESET_ALL}")
         return
     
+    # Collect the listing and write it with a single print
+    lines = []
+    
     # Header
     if filter_tag:
-        print(f"\n{Fore.BLUE}{Style.BRIGHT}📋 Tasks filtered by '{filter_tag}':{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}{Style.BRIGHT}📋 Tasks filtered by '{filter_tag}':{Style.RESET_ALL}")
     else:
-        print(f"\n{Fore.BLUE}{Style.BRIGHT}📋 Your Tasks:{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}{Style.BRIGHT}📋 Your Tasks:{Style.RESET_ALL}")
     
-    print(f"{Fore.BLUE}-" * 60 + Style.RESET_ALL)
+    lines.append(f"{Fore.BLUE}{'-' * 60}{Style.RESET_ALL}")
     
     for task in tasks:
         if task["completed"]:
@@ -246,23 +629,64 @@ def list_tasks(filter_tag=None):
             tags_formatted = [f"{Fore.MAGENTA}#{tag}{Style.RESET_ALL}" for tag in task["tags"]]
             tags_display = f" {' '.join(tags_formatted)}"
         
-        print(f"{status_color}{status} [{task['id']}] {Style.BRIGHT}{task['name']}{Style.RESET_ALL} {Fore.CYAN}- {task['duration']}min{Style.RESET_ALL}{tags_display}")
+        lines.append(f"{status_color}{status} [{task['id']}] {Style.BRIGHT}{task['name']}{Style.RESET_ALL} {Fore.CYAN}- {task['duration']}min{Style.RESET_ALL}{tags_display}")
     
-    print(f"{Fore.BLUE}-" * 60 + Style.RESET_ALL)
+    lines.append(f"{Fore.BLUE}{'-' * 60}{Style.RESET_ALL}")
     
     # Show tag summary if not filtering
     if not filter_tag:
-        all_tags = {}
-        for task in tasks:
-            for tag in task.get("tags", []):
-                all_tags[tag.lower()] = all_tags.get(tag.lower(), 0) + 1
+        all_tags = Counter(tag.lower() for task in tasks for tag in task.get("tags", ()))
         
         if all_tags:
-            print(f"\n{Fore.CYAN}Available tags:{Style.RESET_ALL} ", end="")
             tag_items = [f"{Fore.MAGENTA}#{tag}{Style.RESET_ALL} ({count})" for tag, count in sorted(all_tags.items())]
-            print(", ".join(tag_items))
+            lines.append(f"\n{Fore.CYAN}Available tags:{Style.RESET_ALL} " + ", ".join(tag_items))
+    
+    print("\n".join(lines))
+
+def stop_timer(signum, frame):
+    """SIGINT handler installed while a timer runs: wake the timer instead of raising KeyboardInterrupt"""
+    TIMER_STOP.set()
+
+class TimerInput:
+    """
+    Lets Enter stop a running timer on a POSIX terminal
+    
+    wait() stands in for TIMER_STOP.wait(): a single select() watches stdin
+    and a wakeup pipe that Ctrl-C writes to, so either ends the wait at once.
+    """
+    
+    def __init__(self):
+        import selectors
+        
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(sys.stdin, selectors.EVENT_READ)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._previous_wakeup_fd = signal.set_wakeup_fd(self._wake_w)
+    
+    def wait(self, timeout):
+        """
+        Wait until the timeout passes or the timer is stopped
+        
+        Returns:
+            bool: True if the timer was stopped
+        """
+        for key, _ in self._selector.select(timeout):
+            if key.fileobj is sys.stdin:
+                # Consume the typed line so it doesn't reach the shell
+                sys.stdin.readline()
+                TIMER_STOP.set()
+        return TIMER_STOP.is_set()
+    
+    def close(self):
+        """Restore the previous wakeup fd and release the pipe"""
+        signal.set_wakeup_fd(self._previous_wakeup_fd)
+        self._selector.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
 
-def run_timer(duration_minutes, label, is_break=False, silent=False):
+def run_timer(duration_minutes, label, is_break=False, silent=False, quiet=False):
     """
     Run a timer for the specified duration
     
@@ -271,6 +695,7 @@ def run_timer(duration_minutes, label, is_break=False, silent=False):
         label: Label to display for the timer
         is_break: Whether this is a break timer (affects colors)
         silent: Whether to disable sound notification
+        quiet: Whether to skip the live countdown and wait in a single sleep
     
     Returns:
         bool: True if timer completed, False if interrupted
@@ -285,51 +710,86 @@ def run_timer(duration_minutes, label, is_break=False, silent=False):
         print(f"\n{Fore.MAGENTA}⏱️  Starting timer for: {Style.BRIGHT}{label}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Duration: {duration_minutes} minutes{Style.RESET_ALL}\n")
     
+    # Pick colors, icon and thresholds once rather than on every tick.
+    # Colors go from more than half left, to more than a quarter, to the rest.
+    if is_break:
+        # Break timer uses cyan/blue colors
+        colors = (Fore.CYAN, Fore.BLUE, Fore.MAGENTA)
+    else:
+        # Work timer uses green/yellow/red
+        colors = (Fore.GREEN, Fore.YELLOW, Fore.RED)
+    
+    half = duration // 2
+    quarter = duration // 4
+    timer_icon = "☕" if is_break else "⏰"
+    
+    # Everything on the tick line except the time itself is fixed per color
+    prefixes = tuple(f"\r{color}{timer_icon} " for color in colors)
+    suffix = f" remaining{Style.RESET_ALL}"
+    out = sys.stdout
+    
+    TIMER_STOP.clear()
+    previous_handler = signal.signal(signal.SIGINT, stop_timer)
+    timer_input = None
+    
+    # Everything after installing the handler sits in the try, so the
+    # previous handler is restored even if setting up TimerInput fails
     try:
-        for remaining in range(duration, 0, -1):
-            mins, secs = divmod(remaining, 60)
-            
-            # Color coding based on time remaining and timer type
-            if is_break:
-                # Break timer uses cyan/blue colors
-                if remaining > duration * 0.5:
-                    time_color = Fore.CYAN
-                elif remaining > duration * 0.25:
-                    time_color = Fore.BLUE
-                else:
-                    time_color = Fore.MAGENTA
-            else:
-                # Work timer uses green/yellow/red
-                if remaining > duration * 0.5:
-                    time_color = Fore.GREEN
-                elif remaining > duration * 0.25:
-                    time_color = Fore.YELLOW
-                else:
-                    time_color = Fore.RED
-            
-            timer_icon = "☕" if is_break else "⏰"
-            print(f"\r{time_color}{timer_icon} {mins:02d}:{secs:02d} remaining{Style.RESET_ALL}", end='', flush=True)
-            time.sleep(1)
-        
-        # Timer completed - play sound notification unless silent mode
-        if not silent:
-            play_notification_sound()
+        wait = TIMER_STOP.wait
+        if os.name == 'posix' and sys.stdin.isatty():
+            timer_input = TimerInput()
+            wait = timer_input.wait
+            print(f"{Fore.YELLOW}Press Enter to stop early{Style.RESET_ALL}")
         
-        if is_break:
-            print(f"\n\n{Fore.GREEN}{Style.BRIGHT}✨ Break time is over! Ready to get back to work?{Style.RESET_ALL}")
-        else:
-            print(f"\n\n{Fore.GREEN}{Style.BRIGHT}🎉 Time's up! Great work!{Style.RESET_ALL}")
+        deadline = time.monotonic() + duration
+        remaining = duration
+        last_shown = None
         
-        return True
-        
-    except KeyboardInterrupt:
+        while remaining > 0:
+            shown = math.ceil(remaining)
+            
+            # A wait that wakes a hair early leaves the display unchanged
+            if not quiet and shown != last_shown:
+                mins, secs = divmod(shown, 60)
+                
+                # Color coding based on time remaining
+                prefix = prefixes[0] if shown > half else prefixes[1] if shown > quarter else prefixes[2]
+                
+                out.write(f"{prefix}{mins:02d}:{secs:02d}{suffix}")
+                out.flush()
+                last_shown = shown
+            
+            # Wait until the displayed second changes (in quiet mode, until
+            # the end), measured against a fixed deadline so printing never
+            # adds drift. Ctrl-C sets TIMER_STOP and ends the wait
+            # immediately, as does Enter.
+            if wait(remaining if quiet else remaining - (shown - 1)):
+                break
+            remaining = deadline - time.monotonic()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if timer_input:
+            timer_input.close()
+    
+    if TIMER_STOP.is_set():
         if is_break:
             print(f"\n\n{Fore.YELLOW}⏸️  Break interrupted. Back to work early!{Style.RESET_ALL}")
         else:
             print(f"\n\n{Fore.YELLOW}⏸️  Timer stopped.{Style.RESET_ALL}")
         return False
+    
+    # Timer completed - play sound notification unless silent mode
+    if not silent:
+        play_notification_sound()
+    
+    if is_break:
+        print(f"\n\n{Fore.GREEN}{Style.BRIGHT}✨ Break time is over! Ready to get back to work?{Style.RESET_ALL}")
+    else:
+        print(f"\n\n{Fore.GREEN}{Style.BRIGHT}🎉 Time's up! Great work!{Style.RESET_ALL}")
+    
+    return True
 
-def start_timer(task_id, break_duration=None, silent=False):
+def start_timer(task_id, break_duration=None, silent=False, tm=None, quiet=False):
     """
     Start a timer for a specific task with optional break
     
@@ -337,10 +797,14 @@ def start_timer(task_id, break_duration=None, silent=False):
         task_id: ID of the task to start
         break_duration: Optional break duration in minutes (uses config default if True, None means no break)
         silent: Whether to disable sound notifications
+        tm: TaskManager to use (loads a new one if None)
+        quiet: Whether to run the timers without a live countdown
     """
+    if tm is None:
+        tm = TaskManager()
+    
     config = load_config()
-    tasks = load_tasks()
-    task = next((t for t in tasks if t["id"] == task_id), None)
+    task = tm.get_task(task_id)
     
     if not task:
         print(f"{Fore.RED}✗ Task {task_id} not found!{Style.RESET_ALL}")
@@ -358,13 +822,11 @@ def start_timer(task_id, break_duration=None, silent=False):
         print(f"{Fore.YELLOW}   pip install playsound{Style.RESET_ALL}")
     
     # Run the work timer
-    completed = run_timer(task["duration"], task["name"], is_break=False, silent=silent)
+    completed = run_timer(task["duration"], task["name"], is_break=False, silent=silent, quiet=quiet)
     
     if completed:
         # Mark task as completed
-        task["completed"] = True
-        task["completed_at"] = datetime.now().isoformat()
-        save_tasks(tasks)
+        tm.complete_task(task_id)
         
         # Start break timer if requested
         if break_duration is not None:
@@ -376,227 +838,293 @@ def start_timer(task_id, break_duration=None, silent=False):
             response = input(f"{Fore.YELLOW}Start {break_duration}-minute break? (Y/n): {Style.RESET_ALL}").strip().lower()
             
             if response != 'n':
-                run_timer(break_duration, f"Break after {task['name']}", is_break=True, silent=silent)
+                run_timer(break_duration, f"Break after {task['name']}", is_break=True, silent=silent, quiet=quiet)
                 print(f"\n{Fore.GREEN}✓ Task and break completed!{Style.RESET_ALL}")
             else:
                 print(f"{Fore.CYAN}Break skipped. Keep up the momentum!{Style.RESET_ALL}")
         else:
             print(f"\n{Fore.BLUE}💡 Tip: Use --break to add a break timer after completing a task!{Style.RESET_ALL}")
 
-def delete_task(task_id):
+def delete_task(task_id, tm=None):
     """Delete a task"""
-    tasks = load_tasks()
-    task_exists = any(t["id"] == task_id for t in tasks)
+    if tm is None:
+        tm = TaskManager()
     
-    if not task_exists:
+    if not tm.delete(task_id):
         print(f"{Fore.RED}✗ Task {task_id} not found!{Style.RESET_ALL}")
         return
     
-    tasks = [t for t in tasks if t["id"] != task_id]
-    save_tasks(tasks)
     print(f"{Fore.GREEN}✓ Task {task_id} deleted{Style.RESET_ALL}")
 
-def show_stats(filter_tag=None):
+def show_stats(filter_tag=None, tm=None):
     """
     Show completion statistics, optionally filtered by tag
     
     Args:
         filter_tag: Optional tag to filter statistics by
+        tm: TaskManager to use (loads a new one if None)
     """
-    tasks = load_tasks()
+    if tm is None:
+        tm = TaskManager()
     
-    # Filter by tag if specified
-    if filter_tag:
-        tasks = [t for t in tasks if filter_tag.lower() in [tag.lower() for tag in t.get("tags", [])]]
+    summary = tm.get_stats(filter_tag)
+    total = summary["total"]
+    completed = summary["completed"]
+    total_time = summary["total_time"]
     
-    total = len(tasks)
-    completed = sum(1 for t in tasks if t["completed"])
-    total_time = sum(t["duration"] for t in tasks if t["completed"])
+    # Collect the report and write it with a single print
+    lines = []
     
     # Header
     if filter_tag:
-        print(f"\n{Fore.BLUE}{Style.BRIGHT}📊 Statistics for '{filter_tag}':{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}{Style.BRIGHT}📊 Statistics for '{filter_tag}':{Style.RESET_ALL}")
     else:
-        print(f"\n{Fore.BLUE}{Style.BRIGHT}📊 Your Statistics:{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}{Style.BRIGHT}📊 Your Statistics:{Style.RESET_ALL}")
     
-    print(f"{Fore.BLUE}-" * 50 + Style.RESET_ALL)
-    print(f"Total tasks: {Fore.CYAN}{Style.BRIGHT}{total}{Style.RESET_ALL}")
-    print(f"Completed: {Fore.GREEN}{Style.BRIGHT}{completed}{Style.RESET_ALL}")
-    print(f"Pending: {Fore.YELLOW}{Style.BRIGHT}{total - completed}{Style.RESET_ALL}")
-    print(f"Total time spent: {Fore.MAGENTA}{Style.BRIGHT}{total_time} minutes{Style.RESET_ALL}")
+    lines.append(f"{Fore.BLUE}{'-' * 50}{Style.RESET_ALL}")
+    lines.append(f"Total tasks: {Fore.CYAN}{Style.BRIGHT}{total}{Style.RESET_ALL}")
+    lines.append(f"Completed: {Fore.GREEN}{Style.BRIGHT}{completed}{Style.RESET_ALL}")
+    lines.append(f"Pending: {Fore.YELLOW}{Style.BRIGHT}{total - completed}{Style.RESET_ALL}")
+    lines.append(f"Total time spent: {Fore.MAGENTA}{Style.BRIGHT}{total_time} minutes{Style.RESET_ALL}")
     
     # Show breakdown by tag if not filtering
     if not filter_tag:
-        all_tasks = load_tasks()  # Get all tasks again for tag breakdown
-        tag_stats = {}
-        
-        for task in all_tasks:
-            for tag in task.get("tags", []):
-                tag_lower = tag.lower()
-                if tag_lower not in tag_stats:
-                    tag_stats[tag_lower] = {"total": 0, "completed": 0, "time": 0}
-                
-                tag_stats[tag_lower]["total"] += 1
-                if task["completed"]:
-                    tag_stats[tag_lower]["completed"] += 1
-                    tag_stats[tag_lower]["time"] += task["duration"]
+        tag_stats = summary["by_tag"]
         
         if tag_stats:
-            print(f"\n{Fore.CYAN}{Style.BRIGHT}Breakdown by tag:{Style.RESET_ALL}")
-            print(f"{Fore.BLUE}-" * 50 + Style.RESET_ALL)
+            lines.append(f"\n{Fore.CYAN}{Style.BRIGHT}Breakdown by tag:{Style.RESET_ALL}")
+            lines.append(f"{Fore.BLUE}{'-' * 50}{Style.RESET_ALL}")
             
             for tag, stats in sorted(tag_stats.items()):
                 completion_rate = (stats["completed"] / stats["total"] * 100) if stats["total"] > 0 else 0
-                print(f"{Fore.MAGENTA}#{tag}{Style.RESET_ALL}: "
-                      f"{Fore.CYAN}{stats['total']} tasks{Style.RESET_ALL}, "
-                      f"{Fore.GREEN}{stats['completed']} completed{Style.RESET_ALL} "
-                      f"({completion_rate:.0f}%), "
-                      f"{Fore.YELLOW}{stats['time']}min{Style.RESET_ALL}")
+                lines.append(f"{Fore.MAGENTA}#{tag}{Style.RESET_ALL}: "
+                             f"{Fore.CYAN}{stats['total']} tasks{Style.RESET_ALL}, "
+                             f"{Fore.GREEN}{stats['completed']} completed{Style.RESET_ALL} "
+                             f"({completion_rate:.0f}%), "
+                             f"{Fore.YELLOW}{stats['time']}min{Style.RESET_ALL}")
     
-    print(f"{Fore.BLUE}-" * 50 + Style.RESET_ALL)
+    lines.append(f"{Fore.BLUE}{'-' * 50}{Style.RESET_ALL}")
+    print("\n".join(lines))
+
+def cmd_config(args, tm):
+    """Handle 'config [show|set|reset|init]'"""
+    if not args or args[0] == "show":
+        show_config()
+    elif args[0] == "init":
+        init_config()
+    elif args[0] == "reset":
+        reset_config()
+    elif args[0] == "set":
+        if len(args) < 3:
+            print(f"{Fore.RED}Error: Usage: config set <key> <value>{Style.RESET_ALL}")
+            return
+        update_config(args[1], args[2])
+    else:
+        print(f"{Fore.RED}Error: Unknown config command '{args[0]}'{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}Usage: config [show|set|reset|init]{Style.RESET_ALL}")
+
+def cmd_add(args, tm):
+    """Handle 'add <task_name> [duration_minutes] [--tag <tag1> <tag2> ...]'"""
+    if not args:
+        print(f"{Fore.RED}Error: Task name required{Style.RESET_ALL}")
+        return
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="task_timer.py add")
+    parser.add_argument("name")
+    parser.add_argument("duration", type=int, nargs="?")
+    parser.add_argument("--tag", dest="tags", nargs="+", action="extend", default=[], metavar="TAG")
+    options = parser.parse_args(args)
+    
+    name, duration, tags = options.name, options.duration, options.tags
+    
+    # The duration may also come last, after the tags. Only read it that way
+    # when it follows at least one real tag and is at most a day long, so a
+    # lone numeric tag like '--tag 2024' stays a tag.
+    if duration is None and len(tags) > 1 and tags[-1].isdigit() and int(tags[-1]) <= 24 * 60:
+        duration = int(tags.pop())
+    
+    if duration is not None and duration <= 0:
+        print(f"{Fore.RED}Error: Duration must be positive{Style.RESET_ALL}")
+        return
+    
+    add_task(name, duration, tags if tags else None, tm)
+
+def cmd_list(args, tm):
+    """Handle 'list [--filter <tag>]'"""
+    filter_tag = None
+    
+    # Check for --filter flag
+    if args and args[0] == "--filter":
+        if len(args) > 1:
+            filter_tag = args[1]
+        else:
+            print(f"{Fore.RED}Error: Tag name required after --filter{Style.RESET_ALL}")
+            return
+    
+    list_tasks(filter_tag, tm)
+
+def cmd_start(args, tm):
+    """Handle 'start <task_id> [--break [<minutes>]] [--silent] [--quiet]'"""
+    if not args:
+        print(f"{Fore.RED}Error: Task ID required{Style.RESET_ALL}")
+        return
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog="task_timer.py start")
+    parser.add_argument("task_id", type=int)
+    # A bare --break uses the configured default break length
+    parser.add_argument("--break", dest="break_duration", type=int, nargs="?", const=True, metavar="MINUTES")
+    parser.add_argument("--silent", action="store_true")
+    # No live countdown: the timer sleeps once until it's done
+    parser.add_argument("--quiet", action="store_true")
+    options = parser.parse_args(args)
+    
+    if options.break_duration is not None and options.break_duration <= 0:
+        print(f"{Fore.RED}Error: Duration must be positive{Style.RESET_ALL}")
+        return
+    
+    start_timer(options.task_id, options.break_duration, options.silent, tm, options.quiet)
+
+def cmd_delete(args, tm):
+    """Handle 'delete <task_id>'"""
+    if not args:
+        print(f"{Fore.RED}Error: Task ID required{Style.RESET_ALL}")
+        return
+    
+    if not args[0].isdigit():
+        print(f"{Fore.RED}Error: Task ID must be a number{Style.RESET_ALL}")
+        return
+    
+    delete_task(int(args[0]), tm)
+
+def cmd_compact(args, tm):
+    """Handle 'compact'"""
+    tm.compact()
+    print(f"{Fore.GREEN}✓ Journal folded into the data file{Style.RESET_ALL}")
+
+def cmd_stats(args, tm):
+    """Handle 'stats [--filter <tag>]'"""
+    filter_tag = None
+    
+    # Check for --filter flag
+    if args and args[0] == "--filter":
+        if len(args) > 1:
+            filter_tag = args[1]
+        else:
+            print(f"{Fore.RED}Error: Tag name required after --filter{Style.RESET_ALL}")
+            return
+    
+    show_stats(filter_tag, tm)
+
+def cmd_repl(args, tm):
+    """
+    Handle 'repl': run commands typed at a prompt in this one process
+    
+    The TaskManager is shared between commands and refreshed from the
+    task cache before each one, so only changes made on disk are re-read.
+    """
+    import shlex
+    
+    print(f"{Fore.CYAN}Type commands without 'python task_timer.py' (e.g. 'list'); 'exit' to quit{Style.RESET_ALL}")
+    
+    while True:
+        try:
+            line = input("task> ")
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+        
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"{Fore.RED}Error: Invalid input - {e}{Style.RESET_ALL}")
+            continue
+        
+        if not argv:
+            continue
+        if argv[0] in ("exit", "quit"):
+            return
+        
+        handler = COMMANDS.get(argv[0])
+        if handler is None or argv[0] == "repl":
+            print(f"{Fore.RED}Unknown command: {argv[0]}{Style.RESET_ALL}")
+            continue
+        
+        try:
+            tm.reload()
+            handler(argv[1:], tm)
+        except SystemExit:
+            # argparse exits after printing its own usage error
+            pass
+        except ValueError as e:
+            print(f"{Fore.RED}Error: Invalid input - {e}{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.RED}An error occurred: {e}{Style.RESET_ALL}")
+
+# Command name -> handler taking the remaining arguments and the TaskManager
+COMMANDS = {
+    "config": cmd_config,
+    "add": cmd_add,
+    "list": cmd_list,
+    "start": cmd_start,
+    "delete": cmd_delete,
+    "stats": cmd_stats,
+    "compact": cmd_compact,
+    "repl": cmd_repl,
+}
 
 def main():
     """Main CLI interface"""
+    init_colors()
     
     if len(sys.argv) < 2:
         config = load_config()
-        print(f"{Fore.CYAN}{Style.BRIGHT}Task Timer CLI - Pomodoro Timer & Task Tracker{Style.RESET_ALL}")
-        print(f"\n{Fore.YELLOW}Usage:{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}python task_timer.py add <task_name> [duration_minutes] [--tag <tag1> <tag2> ...]{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}python task_timer.py list [--filter <tag>]{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}python task_timer.py start <task_id> [--break [<minutes>]] [--silent]{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}python task_timer.py delete <task_id>{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}python task_timer.py stats [--filter <tag>]{Style.RESET_ALL}")
-        print(f"  {Fore.GREEN}python task_timer.py config [show|set|reset|init]{Style.RESET_ALL}")
-        print(f"\n{Fore.CYAN}Examples:{Style.RESET_ALL}")
-        print(f"  python task_timer.py add \"Team meeting\" 30 --tag work meetings")
-        print(f"  python task_timer.py add \"Study Python\" --tag personal learning  # Uses default {config['default_duration']}min")
-        print(f"  python task_timer.py list --filter work")
-        print(f"  python task_timer.py start 1 --break  # Uses default {config['default_break']}min break")
-        print(f"  python task_timer.py config show")
-        print(f"  python task_timer.py config set default_duration 30")
+        
+        # Build the whole usage text and write it with a single print
+        lines = []
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}Task Timer CLI - Pomodoro Timer & Task Tracker{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.YELLOW}Usage:{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py add <task_name> [duration_minutes] [--tag <tag1> <tag2> ...]{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py list [--filter <tag>]{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py start <task_id> [--break [<minutes>]] [--silent] [--quiet]{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py delete <task_id>{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py stats [--filter <tag>]{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py config [show|set|reset|init]{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py compact{Style.RESET_ALL}")
+        lines.append(f"  {Fore.GREEN}python task_timer.py repl{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.CYAN}Examples:{Style.RESET_ALL}")
+        lines.append(f"  python task_timer.py add \"Team meeting\" 30 --tag work meetings")
+        lines.append(f"  python task_timer.py add \"Study Python\" --tag personal learning  # Uses default {config['default_duration']}min")
+        lines.append(f"  python task_timer.py list --filter work")
+        lines.append(f"  python task_timer.py start 1 --break  # Uses default {config['default_break']}min break")
+        lines.append(f"  python task_timer.py config show")
+        lines.append(f"  python task_timer.py config set default_duration 30")
         
         if not COLORS_AVAILABLE:
-            print(f"\n💡 Tip: Install colorama for colorful output!")
-            print(f"   pip install colorama")
+            lines.append(f"\n💡 Tip: Install colorama for colorful output!")
+            lines.append(f"   pip install colorama")
         
         if not SOUND_AVAILABLE:
-            print(f"\n💡 Tip: Install playsound for audio notifications!")
-            print(f"   pip install playsound")
+            lines.append(f"\n💡 Tip: Install playsound for audio notifications!")
+            lines.append(f"   pip install playsound")
         
+        print("\n".join(lines))
         return
     
     command = sys.argv[1]
+    handler = COMMANDS.get(command)
+    
+    if handler is None:
+        print(f"{Fore.RED}Unknown command: {command}{Style.RESET_ALL}")
+        return
     
     try:
-        if command == "config":
-            # Configuration commands
-            if len(sys.argv) < 3:
-                show_config()
-            elif sys.argv[2] == "show":
-                show_config()
-            elif sys.argv[2] == "init":
-                init_config()
-            elif sys.argv[2] == "reset":
-                reset_config()
-            elif sys.argv[2] == "set":
-                if len(sys.argv) < 5:
-                    print(f"{Fore.RED}Error: Usage: config set <key> <value>{Style.RESET_ALL}")
-                    return
-                update_config(sys.argv[3], sys.argv[4])
-            else:
-                print(f"{Fore.RED}Error: Unknown config command '{sys.argv[2]}'{Style.RESET_ALL}")
-                print(f"{Fore.YELLOW}Usage: config [show|set|reset|init]{Style.RESET_ALL}")
-        
-        elif command == "add":
-            if len(sys.argv) < 3:
-                print(f"{Fore.RED}Error: Task name required{Style.RESET_ALL}")
-                return
-            
-            name = sys.argv[2]
-            duration = None
-            tags = []
-            
-            # Parse duration and tags
-            i = 3
-            while i < len(sys.argv):
-                if sys.argv[i] == "--tag":
-                    # Collect all tags after --tag flag
-                    i += 1
-                    while i < len(sys.argv) and not sys.argv[i].startswith("--"):
-                        tags.append(sys.argv[i])
-                        i += 1
-                elif sys.argv[i].isdigit():
-                    duration = int(sys.argv[i])
-                    i += 1
-                else:
-                    i += 1
-            
-            add_task(name, duration, tags if tags else None)
-        
-        elif command == "list":
-            filter_tag = None
-            
-            # Check for --filter flag
-            if len(sys.argv) > 2 and sys.argv[2] == "--filter":
-                if len(sys.argv) > 3:
-                    filter_tag = sys.argv[3]
-                else:
-                    print(f"{Fore.RED}Error: Tag name required after --filter{Style.RESET_ALL}")
-                    return
-            
-            list_tasks(filter_tag)
-        
-        elif command == "start":
-            if len(sys.argv) < 3:
-                print(f"{Fore.RED}Error: Task ID required{Style.RESET_ALL}")
-                return
-            
-            task_id = int(sys.argv[2])
-            
-            # Parse flags
-            break_duration = None
-            silent = False
-            
-            i = 3
-            while i < len(sys.argv):
-                if sys.argv[i] == "--break":
-                    if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
-                        break_duration = int(sys.argv[i + 1])
-                        i += 2
-                    else:
-                        break_duration = True  # Use config default
-                        i += 1
-                elif sys.argv[i] == "--silent":
-                    silent = True
-                    i += 1
-                else:
-                    i += 1
-            
-            start_timer(task_id, break_duration, silent)
-        
-        elif command == "delete":
-            if len(sys.argv) < 3:
-                print(f"{Fore.RED}Error: Task ID required{Style.RESET_ALL}")
-                return
-            task_id = int(sys.argv[2])
-            delete_task(task_id)
-        
-        elif command == "stats":
-            filter_tag = None
-            
-            # Check for --filter flag
-            if len(sys.argv) > 2 and sys.argv[2] == "--filter":
-                if len(sys.argv) > 3:
-                    filter_tag = sys.argv[3]
-                else:
-                    print(f"{Fore.RED}Error: Tag name required after --filter{Style.RESET_ALL}")
-                    return
-            
-            show_stats(filter_tag)
-        
-        else:
-            print(f"{Fore.RED}Unknown command: {command}{Style.RESET_ALL}")
+        # Load the task list once and share it across the command's helpers
+        tm = TaskManager() if command != "config" else None
+        handler(sys.argv[2:], tm)
     
     except ValueError as e:
         print(f"{Fore.RED}Error: Invalid input - {e}{Style.RESET_ALL}")
@@ -8,10 +8,13 @@ from logging import root
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import time
-from task_timer import TaskManager, play_notification_sound, DEFAULT_BREAK_DURATION
-import csv
+import math
+from task_timer import TaskManager, play_notification_sound, load_config
 from pathlib import Path
 
+# Column titles for the CSV export
+_CSV_HEADER = ("ID", "Name", "Duration (minutes)", "Completed", "Created At", "Completed At")
+
 class TaskTimerApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -20,6 +23,13 @@ class TaskTimerApp(tk.Tk):
 
         self.task_manager = TaskManager()
         self.timer_id = None
+        self._last_shown = None
+
+        # Current timer state
+        self._paused = False
+        self._remaining = 0
+        self._current_task = None
+        self._current_task_id = None
 
         # --- UI Components ---
         self.create_widgets()
@@ -35,6 +45,7 @@ class TaskTimerApp(tk.Tk):
         self.task_listbox = tk.Listbox(list_frame, height=10, selectmode=tk.SINGLE)
         self.task_listbox.pack(fill=tk.BOTH, expand=True, pady=5)
         self.task_listbox.bind("<Double-1>", self.start_selected_task)
+        self.bind("<F5>", self.reload_tasks)
 
         # Frame for buttons
         button_frame = ttk.Frame(self, padding="10")
@@ -68,16 +79,47 @@ class TaskTimerApp(tk.Tk):
         self.status_label = ttk.Label(timer_frame, text="", font=("Helvetica", 10))
         self.status_label.pack(pady=5)
 
-        #paused
-        global paused
-        paused=0
+        # Widgets locked while a timer is running
+        self._toggle_widgets = (self.add_button, self.start_button, self.delete_button, self.task_listbox)
 
     def refresh_task_list(self):
+        # Full rebuild; single changes go through add_row/remove_row/update_row
         self.task_listbox.delete(0, tk.END)
-        self.task_manager.tasks = self.task_manager._load() # Reload tasks
+        self._row_ids = []
         for task in self.task_manager.tasks:
-            status = "✓" if task["completed"] else "○"
-            self.task_listbox.insert(tk.END, f"{status} [{task['id']}] {task['name']} ({task['duration']} min)")
+            self.add_row(task)
+
+    def format_row(self, task):
+        status = "✓" if task["completed"] else "○"
+        return f"{status} [{task['id']}] {task['name']} ({task['duration']} min)"
+
+    def add_row(self, task):
+        self.task_listbox.insert(tk.END, self.format_row(task))
+        self._row_ids.append(task["id"])
+
+    def remove_row(self, task_id):
+        if task_id not in self._row_ids:
+            return
+        index = self._row_ids.index(task_id)
+        self.task_listbox.delete(index)
+        del self._row_ids[index]
+
+    def update_row(self, task):
+        if task["id"] not in self._row_ids:
+            return
+        index = self._row_ids.index(task["id"])
+        self.task_listbox.delete(index)
+        self.task_listbox.insert(index, self.format_row(task))
+
+    def reload_tasks(self, event=None):
+        # Pick up changes made outside the app (e.g. by the CLI).
+        # Not while a timer runs: the list is disabled then, and Tk would
+        # ignore the rebuild, leaving the rows out of step with _row_ids.
+        if str(self.task_listbox.cget("state")) == tk.DISABLED:
+            return
+        self.task_manager.reload()
+        self.refresh_task_list()
+        self.status_label.config(text="Tasks reloaded.")
 
     def add_task(self):
         name = simpledialog.askstring("Add Task", "Enter task name:")
@@ -91,8 +133,8 @@ class TaskTimerApp(tk.Tk):
             messagebox.showerror("Error", "Invalid duration. Please enter a number.")
             return
 
-        self.task_manager.add(name, duration)
-        self.refresh_task_list()
+        task = self.task_manager.add(name, duration)
+        self.add_row(task)
         self.status_label.config(text=f"Added task: {name}")
 
     def get_selected_task_id(self):
@@ -100,34 +142,20 @@ class TaskTimerApp(tk.Tk):
         if not selection:
             messagebox.showwarning("No Selection", "Please select a task from the list.")
             return None
-        
-        selected_text = self.task_listbox.get(selection[0])
-        # Extracts ID from string like "○ [1] Task Name (25 min)"
-        try:
-            task_id = int(selected_text.split('[')[1].split(']')[0])
-            return task_id
-        except (IndexError, ValueError):
-            messagebox.showerror("Error", "Could not identify the selected task.")
-            return None
 
-    def start_selected_task(self, event=None):
-        global task_id
-        task_id= self.get_selected_task_id()
-        if task_id is None:
-            return
-        try:
-            if paused==1:
-                return
+        return self._row_ids[selection[0]]
 
-        except:
-            print("Error")
+    def start_selected_task(self, event=None):
+        task_id = self.get_selected_task_id()
+        if task_id is None or self._paused:
             return
-        global task
         task = self.task_manager.get_task(task_id)
         if task['completed']:
             messagebox.showinfo("Task Completed", "This task has already been completed.")
             return
 
+        self._current_task = task
+        self._current_task_id = task_id
         self.run_timer(task['duration'], task['name'], task_id)
 
 
@@ -138,7 +166,7 @@ class TaskTimerApp(tk.Tk):
 
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete task {task_id}?"):
             if self.task_manager.delete(task_id):
-                self.refresh_task_list()
+                self.remove_row(task_id)
                 self.status_label.config(text=f"Deleted task {task_id}")
             else:
                 messagebox.showerror("Error", "Failed to delete the task.")
@@ -152,22 +180,29 @@ class TaskTimerApp(tk.Tk):
 
         
         end_time = time.time() + duration_minutes * 60 
+        self._last_shown = None
 
         def update_display():
-            global remaining
-            remaining = end_time - time.time()
+            remaining = self._remaining = end_time - time.time()
             if remaining > 0:
-                mins, secs = divmod(int(remaining), 60)
-                self.timer_label.config(text=f"{mins:02d}:{secs:02d}")
-                self.timer_id = self.after(1000, update_display)
+                # Round up like the CLI, so a 90-minute task starts at 90:00
+                shown = math.ceil(remaining)
+                if shown != self._last_shown:
+                    mins, secs = divmod(shown, 60)
+                    self.timer_label.config(text=f"{mins:02d}:{secs:02d}")
+                    self._last_shown = shown
+                # Wake up right when the displayed second changes
+                delay_ms = max(1, int((remaining - (shown - 1)) * 1000))
+                self.timer_id = self.after(delay_ms, update_display)
             else:
                 self.timer_label.config(text="00:00")
                 play_notification_sound()
                 self.enable_buttons()
 
                 if not is_break and task_id:
-                    self.task_manager.complete_task(task_id)
-                    self.refresh_task_list()
+                    # The task may have been deleted while the timer was paused
+                    if self.task_manager.complete_task(task_id):
+                        self.update_row(self.task_manager.get_task(task_id))
                     messagebox.showinfo("Time's Up!", f"Great work on '{label}'!")
                     self.prompt_for_break(label)
                 elif is_break:
@@ -176,33 +211,28 @@ class TaskTimerApp(tk.Tk):
 
         update_display()
     def pause_timer(self):
-        global paused
-        paused=0
-        task = self.task_manager.get_task(task_id)
+        task = self._current_task
+        if task is None or task['completed'] or self._paused:
+            return
 
+        self.after_cancel(self.timer_id)
+        self.status_label.config(text="Timer paused.")
+        self.pause_button.config(text="Resume", command=self.resume_timer)
+        self.pause_button.config(state=tk.NORMAL)
+        self._paused = True
+        self.enable_buttons()
 
-        if not task['completed']:
-            if (paused==1):
-                pass
-            else:
-                self.after_cancel(self.timer_id)
-                self.status_label.config(text="Timer paused.")
-                self.pause_button.config(text="Resume", command=self.resume_timer)
-                self.pause_button.config(state=tk.NORMAL)
-                paused=1
-                self.enable_buttons()
     def resume_timer(self):
-        paused=0
-
-        self.run_timer(remaining/60, task['name'], task_id)
+        self._paused = False
+        self.run_timer(self._remaining / 60, self._current_task['name'], self._current_task_id)
         self.pause_button.config(text="Pause", command=self.pause_timer)
         self.pause_button.config(state=tk.NORMAL)
     
     def reset_timer(self):
         
-        global paused, remaining
-        paused = 0
-        remaining = 0
+        self._paused = False
+        self._remaining = 0
+        self._last_shown = None
         
         if self.timer_id:
             self.after_cancel(self.timer_id)  # Stop any running countdown
@@ -218,6 +248,8 @@ class TaskTimerApp(tk.Tk):
         self.enable_buttons()
 
     def export_to_csv(self):
+        import csv
+
         tasks = self.task_manager.tasks
         if not tasks:
             messagebox.showinfo("Export", "No tasks to export.")
@@ -225,50 +257,40 @@ class TaskTimerApp(tk.Tk):
 
         csv_file = Path.cwd() / "task_timer_export.csv"
         try:
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=["ID", "Name", "Duration (minutes)", "Completed", "Created At", "Completed At"])
-                writer.writeheader()
-                for task in tasks:
-                    writer.writerow({
-                        "ID": task.get("id"),
-                        "Name": task.get("name"),
-                        "Duration (minutes)": task.get("duration"),
-                        "Completed": task.get("completed"),
-                        "Created At": task.get("created_at"),
-                        "Completed At": task.get("completed_at", "")
-                    })
+            # One large buffer so the whole export goes out in a few writes
+            with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(_CSV_HEADER)
+                writer.writerows(
+                    (task.get("id"), task.get("name"), task.get("duration"), task.get("completed"),
+                     task.get("created_at"), task.get("completed_at", ""))
+                    for task in tasks
+                )
             messagebox.showinfo("Export", f"Tasks exported to {csv_file}")
         except Exception as e:
             messagebox.showerror("Export Failed", f"Could not export tasks:\n{e}")
 
     def prompt_for_break(self, task_name):
-        if messagebox.askyesno("Break Time?", f"Start a {DEFAULT_BREAK_DURATION}-minute break?"):
-            self.run_timer(DEFAULT_BREAK_DURATION, f"Break after {task_name}", is_break=True)
+        # Read at prompt time so 'config set default_break' applies
+        break_duration = load_config()["default_break"]
+        if messagebox.askyesno("Break Time?", f"Start a {break_duration}-minute break?"):
+            self.run_timer(break_duration, f"Break after {task_name}", is_break=True)
+
+    def _set_enabled(self, enabled):
+        state = tk.NORMAL if enabled else tk.DISABLED
+        for widget in self._toggle_widgets:
+            # Skip the Tcl call when the widget is already in that state
+            if str(widget.cget("state")) != state:
+                widget.config(state=state)
 
     def disable_buttons(self):
-        self.add_button.config(state=tk.DISABLED)
-        self.start_button.config(state=tk.DISABLED)
-        self.delete_button.config(state=tk.DISABLED)
-        self.task_listbox.config(state=tk.DISABLED)
-        
-
+        self._set_enabled(False)
 
     def enable_buttons(self):
-        self.add_button.config(state=tk.NORMAL)
-        self.start_button.config(state=tk.NORMAL)
-        self.delete_button.config(state=tk.NORMAL)
-        self.task_listbox.config(state=tk.NORMAL)
-        
-        
-        if (paused==1):
-            # self.timer_label.config(text="Timer paused")
-            pass
-            
-        else:
-
+        self._set_enabled(True)
 
+        if not self._paused:
             self.timer_label.config(text="Select a task to start")
-
             self.status_label.config(text="Timer finished.")
 
 
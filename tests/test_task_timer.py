@@ -0,0 +1,87 @@
+"""
+Tests for task_timer
+Run with: python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import task_timer
+from task_timer import TaskManager
+
+
+class TaskTimerTestCase(unittest.TestCase):
+    """Points the config and data files at a temporary directory"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_file = Path(tmp.name) / "tasks.json"
+
+        original_config_file = task_timer.CONFIG_FILE
+        task_timer.CONFIG_FILE = Path(tmp.name) / "config.json"
+        self.addCleanup(setattr, task_timer, "CONFIG_FILE", original_config_file)
+
+        config = task_timer.load_config()
+        config["data_file"] = str(self.data_file)
+        task_timer.save_config(config)
+
+    def saved_tasks(self):
+        return json.loads(self.data_file.read_text(encoding="utf-8"))
+
+
+class TestTaskManager(TaskTimerTestCase):
+
+    def test_two_managers_do_not_share_tasks(self):
+        a = TaskManager()
+        b = TaskManager()
+        a.add("from a", 25)
+        self.assertEqual(b.tasks, [])
+
+        c = TaskManager()
+        c.add("from c", 25)
+        self.assertEqual([t["name"] for t in a.tasks], ["from a"])
+        self.assertEqual([(t["id"], t["name"]) for t in self.saved_tasks()],
+                         [(1, "from a"), (2, "from c")])
+
+    def test_cached_load_returns_a_fresh_list(self):
+        TaskManager().add("first", 25)
+        first = task_timer.load_tasks()
+        first[0]["completed"] = True
+        first.append({"id": 2})
+
+        self.assertEqual(task_timer.load_tasks(), self.saved_tasks())
+
+
+class TestCmdAdd(TaskTimerTestCase):
+
+    def add(self, *args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            task_timer.cmd_add(list(args), TaskManager())
+        return self.saved_tasks()[-1]
+
+    def test_single_numeric_tag_stays_a_tag(self):
+        task = self.add("Report", "--tag", "2024")
+        self.assertEqual(task["tags"], ["2024"])
+        self.assertEqual(task["duration"], task_timer.DEFAULT_CONFIG["default_duration"])
+
+    def test_trailing_number_after_tags_is_the_duration(self):
+        task = self.add("Report", "--tag", "work", "45")
+        self.assertEqual(task["tags"], ["work"])
+        self.assertEqual(task["duration"], 45)
+
+    def test_trailing_number_longer_than_a_day_stays_a_tag(self):
+        task = self.add("Report", "--tag", "work", "2024")
+        self.assertEqual(task["tags"], ["work", "2024"])
+        self.assertEqual(task["duration"], task_timer.DEFAULT_CONFIG["default_duration"])
+
+
+if __name__ == "__main__":
+    unittest.main()